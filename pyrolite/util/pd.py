@@ -200,15 +200,12 @@ def zero_to_nan(df, rtol=1e-5, atol=1e-8):
     :class:`pandas.DataFrame`
         Censored DataFrame.
     """
-    cols = [
-        name
-        for (name, type) in zip(df.columns, df.dtypes)
-        if isinstance(type, np.float)
-    ]
-    df.loc[:, cols] = np.where(
-        np.isclose(df[cols].values, 0.0, rtol=rtol, atol=atol), np.nan, df[cols].values
-    )
-    df.loc[:, cols] = np.where(df[cols].values < 0.0, np.nan, df[cols].values)
+    cols = df.select_dtypes(include=[np.floating]).columns
+    if cols.size:
+        # build the mask in one pass, but mask column-wise to keep float widths
+        arr = df[cols].values
+        censor = np.isclose(arr, 0.0, rtol=rtol, atol=atol) | (arr < 0.0)
+        df[cols] = df[cols].mask(censor)
     return df
 
 
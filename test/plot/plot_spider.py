@@ -22,10 +22,13 @@ except ImportError:
 class TestSpiderplot(unittest.TestCase):
     """Tests the Spiderplot functionality."""
 
+    @classmethod
+    def setUpClass(cls):
+        cls.els = REE()
+        cls.arr = random_composition(size=10, D=len(cls.els), seed=0)
+
     def setUp(self):
         self.fig, self.ax = plt.subplots(1)
-        self.els = REE()
-        self.arr = random_composition(size=10, D=len(self.els))
 
     def test_none(self):
         """Test generation of plot with no data."""
@@ -84,10 +87,14 @@ class TestSpiderplot(unittest.TestCase):
 class TestREERadiiPlot(unittest.TestCase):
     """Tests the REE_radii_plot functionality."""
 
+    @classmethod
+    def setUpClass(cls):
+        cls.reels = REE()
+        rng = np.random.default_rng(0)
+        cls.arr = rng.random((10, len(cls.reels)), dtype=np.float32)
+
     def setUp(self):
         self.fig, self.ax = plt.subplots(1)
-        self.reels = REE()
-        self.arr = np.random.rand(10, len(self.reels))
 
     def test_none(self):
         """Test generation of plot with no data."""
@@ -144,6 +144,47 @@ class TestToNumeric(unittest.TestCase):
                     self.assertTrue(method == "raise")
 
 
+class TestZeroToNaN(unittest.TestCase):
+    def setUp(self):
+        self.df = pd.DataFrame(
+            {"A": [0.0, 1.0, -1.0, 1e-10], "B": [0, 1, 2, 3], "C": list("abcd")}
+        )
+
+    def test_default(self):
+        result = zero_to_nan(self.df.copy())
+        expect = [True, False, True, True]
+        self.assertTrue(result["A"].isnull().values.tolist() == expect)
+
+    def test_non_float_columns_unchanged(self):
+        result = zero_to_nan(self.df.copy())
+        self.assertTrue((result["B"] == self.df["B"]).all())
+        self.assertTrue((result["C"] == self.df["C"]).all())
+
+    def test_tolerance(self):
+        result = zero_to_nan(self.df.copy(), atol=1e-12)
+        self.assertFalse(pd.isnull(result.loc[3, "A"]))
+
+    def test_mixed_float_dtypes(self):
+        df = pd.DataFrame(
+            {
+                "A": np.array([0.0, 1.0], dtype=np.float32),
+                "B": np.array([1.0, 0.0], dtype=np.float64),
+            }
+        )
+        result = zero_to_nan(df.copy())
+        self.assertTrue((result.dtypes == df.dtypes).all())
+        self.assertTrue(pd.isnull(result.loc[0, "A"]))
+        self.assertTrue(pd.isnull(result.loc[1, "B"]))
+        self.assertEqual(result.loc[1, "A"], 1.0)
+
+    def test_existing_nan(self):
+        df = pd.DataFrame({"A": [np.nan, 0.0, 2.0]})
+        result = zero_to_nan(df.copy())
+        expect = [True, True, False]
+        self.assertTrue(result["A"].isnull().values.tolist() == expect)
+        self.assertEqual(result.loc[2, "A"], 2.0)
+
+
 class TestOutliers(unittest.TestCase):
     def setUp(self):
         self.df = normal_frame()